@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import mmap
 import os
+import queue
+import sys
+import threading
 from zipfile import ZIP_STORED
 
-from chunky_zip.compressed_zip import ChunkedCompressedZipWriter
+from chunky_zip.compressed_zip import (
+    _WRITER_BY_COMPRESSION,
+    ChunkedBzip2ZipWriter,
+    ChunkedCompressedZipWriter,
+    ChunkedDeflateZipWriter,
+    ChunkedLzmaZipWriter,
+)
 from chunky_zip.storage_zip import ChunkedStoredZipWriter
 
 
-DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+SMALL_FILE_LIMIT = 256 * 1024
+
+# Same gate shutil uses for its sendfile fast path: macOS and FreeBSD have
+# os.sendfile too, but only accept a socket as the output descriptor
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
 
 
 # Helper functions remain the same as before
@@ -19,27 +34,90 @@ def read_file_in_chunks(file_obj, chunk_size=DEFAULT_CHUNK_SIZE):
         yield chunk
 
 
-def zip_file_in_chunks(input_file, output_zip, compression):
+def read_mmap_in_chunks(file_obj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield zero-copy memoryview slices over a read-only mapping of the file.
+
+    Unlike read_file_in_chunks this allocates no per-chunk bytes objects;
+    the kernel prefetcher handles readahead. The mapping is reclaimed once
+    the last yielded slice is garbage-collected.
+    """
+    mm = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    size = len(mm)
+    can_prefault = hasattr(mmap, "MADV_WILLNEED")
+    view = memoryview(mm)
+    for i in range(0, size, chunk_size):
+        if can_prefault and i + chunk_size < size:
+            # Start readahead for the next chunk now, so its pages are
+            # resident before the consumer faults on them
+            start = (i + chunk_size) & ~(mmap.PAGESIZE - 1)
+            mm.madvise(mmap.MADV_WILLNEED, start, min(chunk_size, size - start))
+        yield view[i : i + chunk_size]
+
+
+def zip_file_in_chunks(
+    input_file, output_zip, compression, chunk_size=DEFAULT_CHUNK_SIZE
+):
     filename_in_zip = os.path.basename(input_file)
 
+    file_size = os.path.getsize(input_file)
+    if 0 < file_size < SMALL_FILE_LIMIT:
+        # Small files fit in one chunk; no point iterating below that
+        chunk_size = file_size
+
     if compression == ZIP_STORED:
-        with open(input_file, "rb") as src:
-            for chunk in read_file_in_chunks(src):
-                with ChunkedStoredZipWriter(output_zip, filename_in_zip) as zw:
+        with open(input_file, "rb") as src, ChunkedStoredZipWriter(
+            output_zip, filename_in_zip
+        ) as zw:
+            if _USE_SENDFILE:
+                zw.write_from_fd(src.fileno(), file_size)
+            else:
+                for chunk in read_file_in_chunks(src, chunk_size):
                     zw.write_chunk(chunk)
 
-            with ChunkedStoredZipWriter(output_zip, filename_in_zip) as zw:
-                zw.flush()
+            zw.flush()
 
     else:
-        with open(input_file, "rb") as src:
-            for chunk in read_file_in_chunks(src):
-                with ChunkedCompressedZipWriter(
-                    output_zip, filename_in_zip, compression
-                ) as zw:
+        # Pick the specialized writer once; its flush()/close() carry no
+        # per-compression branching
+        writer_cls = _WRITER_BY_COMPRESSION.get(compression, ChunkedCompressedZipWriter)
+
+        with open(input_file, "rb") as src, writer_cls(
+            output_zip, filename_in_zip, compression
+        ) as zw:
+            # Bounded queue between a reader thread and the compressing
+            # writer so disk reads overlap compression + archive writes
+            chunks: queue.Queue = queue.Queue(maxsize=2)
+
+            def _reader():
+                if file_size > 0:
+                    source = read_mmap_in_chunks(src, chunk_size)
+                else:
+                    # Zero-length files cannot be mapped
+                    source = read_file_in_chunks(src, chunk_size)
+                for chunk in source:
+                    chunks.put(chunk)
+                chunks.put(None)
+
+            reader = threading.Thread(target=_reader, daemon=True)
+            reader.start()
+
+            try:
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None:
+                        break
                     zw.write_chunk(chunk)
+            finally:
+                # If write_chunk raised, drain the queue so the reader
+                # isn't blocked on put() forever
+                reader.join(timeout=0.1)
+                while reader.is_alive():
+                    try:
+                        chunks.get_nowait()
+                    except queue.Empty:
+                        pass
+                    reader.join(timeout=0.1)
 
-            with ChunkedCompressedZipWriter(
-                output_zip, filename_in_zip, compression
-            ) as zw:
-                zw.flush()
+            zw.flush()
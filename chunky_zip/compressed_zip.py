@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from tempfile import NamedTemporaryFile
-from typing import Dict, Optional, Protocol, Union
+import bz2
+from typing import Optional, Protocol, Union
 from zipfile import (
     ZIP_BZIP2,
     ZIP_DEFLATED,
     ZIP_LZMA,
-    ZipFile,
+    LZMACompressor,
     ZIP_STORED,
 )
 
@@ -15,9 +15,10 @@ from chunky_zip.storage_zip import ChunkedStoredZipWriter
 try:
     import zlib  # We may need its compression method
 
-    Z_FULL_FLUSH = zlib.Z_FULL_FLUSH
+    Z_FINISH = zlib.Z_FINISH
 except ImportError:
-    Z_FULL_FLUSH = 3
+    zlib = None
+    Z_FINISH = 4
 
 ZIP64_LIMIT = (1 << 31) - 1
 
@@ -40,11 +41,6 @@ class SupportsCompressEmptyFlush(Protocol):
     def flush(self) -> bytes: ...
 
 
-zip_compressor_storage: Dict[
-    str, Union[SupportsCompress, SupportsCompressEmptyFlush]
-] = {}
-
-
 class ChunkedCompressedZipWriter(ChunkedStoredZipWriter):
     """A class to write data in chunks to a single file within a ZIP archive without persistent temporary storage."""
 
@@ -52,39 +48,32 @@ class ChunkedCompressedZipWriter(ChunkedStoredZipWriter):
         """
         Initialize the chunked ZIP writer.
         """
-        self.output_zip = output_zip
-        self.filename_in_zip = filename_in_zip
+        # The base __init__ runs _extract_zipinfo, which reads self.compression
         self.compression = compression
-        self.zipinfo = self._extract_zipinfo()
-
-    @property
-    def _compressor_path(self):
-        return f"{self.output_zip}/{self.filename_in_zip}"
+        super().__init__(output_zip, filename_in_zip)
+        self._compressor_obj: Union[
+            SupportsCompress, SupportsCompressEmptyFlush, None
+        ] = None
 
     @property
     def _compressor(self):
-        return self.get_compressor()
+        if self._compressor_obj is None:
+            self._compressor_obj = self.get_compressor()
+        return self._compressor_obj
 
     def get_compressor(self):
-        if self.compression == ZIP_STORED:
-            return EmptyCompress()
-        elif self._compressor_path in zip_compressor_storage:
-            return zip_compressor_storage[self._compressor_path]
-        else:
-            with (
-                NamedTemporaryFile() as temp,
-                ZipFile(temp, "w", compression=self.compression) as zip_file,
-                zip_file.open(self.filename_in_zip, "w") as zip_writer,
-            ):
-                try:
-                    compressor = zip_writer._compressor
-                    zip_writer._compressor = None
-                except AttributeError:
-                    compressor = EmptyCompress()
-                if compressor is None:
-                    compressor = EmptyCompress()
-                zip_compressor_storage[self._compressor_path] = compressor
-            return compressor
+        if self.compression == ZIP_DEFLATED:
+            if zlib is None:
+                # Same error zipfile raises for this configuration
+                raise RuntimeError("Compression requires the (missing) zlib module")
+            # ZIP entries carry raw deflate: no zlib header, wbits=-15
+            return zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        if self.compression == ZIP_BZIP2:
+            return bz2.BZ2Compressor()
+        if self.compression == ZIP_LZMA:
+            # zipfile's wrapper emits the ZIP LZMA properties header
+            return LZMACompressor()
+        return EmptyCompress()
 
     def write_chunk(self, chunk: bytes):
         """
@@ -98,6 +87,10 @@ class ChunkedCompressedZipWriter(ChunkedStoredZipWriter):
         if self.compression not in [ZIP_BZIP2, ZIP_LZMA]:
             return
 
+        if self._compressor_obj is None:
+            # Nothing was ever compressed
+            return
+
         buffered_data = self._compressor.flush()
 
         if len(buffered_data) == 0:
@@ -106,13 +99,77 @@ class ChunkedCompressedZipWriter(ChunkedStoredZipWriter):
         self._write(None, buffered_data)
 
     def close(self):
-        """Finalize the ZIP file"""
-        if self.compression != ZIP_DEFLATED:
-            return
+        """Drain the compressor, then finalize the ZIP file"""
+        if (
+            self._zf is not None
+            and self.compression == ZIP_DEFLATED
+            and self._compressor_obj is not None
+        ):
+            # The stream ends here: Z_FINISH emits the final block and the
+            # best ratio; full-flush restart points are only needed when a
+            # later writer has to resume mid-stream
+            buffered_data = self._compressor.flush(Z_FINISH)
 
-        buffered_data = self._compressor.flush(Z_FULL_FLUSH)
+            if len(buffered_data) > 0:
+                self._write(None, buffered_data)
 
-        if len(buffered_data) == 0:
+        super().close()
+        self._compressor_obj = None
+
+
+class ChunkedDeflateZipWriter(ChunkedCompressedZipWriter):
+    """Writer specialized for ZIP_DEFLATED: the stream drains in close()."""
+
+    def __init__(self, output_zip: str, filename_in_zip: str, compression=ZIP_DEFLATED):
+        super().__init__(output_zip, filename_in_zip, compression)
+
+    def flush(self):
+        """Deflate keeps buffering mid-stream; nothing to drain here."""
+
+    def close(self):
+        if self._zf is not None and self._compressor_obj is not None:
+            buffered_data = self._compressor.flush(Z_FINISH)
+
+            if len(buffered_data) > 0:
+                self._write(None, buffered_data)
+
+        # Skip the generic close(); the drain above is all deflate needs
+        ChunkedStoredZipWriter.close(self)
+        self._compressor_obj = None
+
+
+class ChunkedBzip2ZipWriter(ChunkedCompressedZipWriter):
+    """Writer specialized for ZIP_BZIP2: one end-of-stream flush()."""
+
+    def __init__(self, output_zip: str, filename_in_zip: str, compression=ZIP_BZIP2):
+        super().__init__(output_zip, filename_in_zip, compression)
+
+    def flush(self):
+        if self._compressor_obj is None:
+            # Nothing was ever compressed
             return
 
-        self._write(None, buffered_data)
+        buffered_data = self._compressor.flush()
+
+        if len(buffered_data) > 0:
+            self._write(None, buffered_data)
+
+    def close(self):
+        """The codec fully drains in flush(); just finalize the archive."""
+        ChunkedStoredZipWriter.close(self)
+        self._compressor_obj = None
+
+
+class ChunkedLzmaZipWriter(ChunkedBzip2ZipWriter):
+    """Writer specialized for ZIP_LZMA; flush semantics match bzip2."""
+
+    def __init__(self, output_zip: str, filename_in_zip: str, compression=ZIP_LZMA):
+        super().__init__(output_zip, filename_in_zip, compression)
+
+
+_WRITER_BY_COMPRESSION = {
+    ZIP_STORED: ChunkedStoredZipWriter,
+    ZIP_DEFLATED: ChunkedDeflateZipWriter,
+    ZIP_BZIP2: ChunkedBzip2ZipWriter,
+    ZIP_LZMA: ChunkedLzmaZipWriter,
+}
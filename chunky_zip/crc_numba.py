@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    def _build_table() -> "np.ndarray":
+        """Precompute the 8x256 slice-by-8 table for the reflected CRC-32."""
+        table = np.zeros((8, 256), dtype=np.uint32)
+        for i in range(256):
+            crc = i
+            for _ in range(8):
+                crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+            table[0, i] = crc
+        for i in range(256):
+            for s in range(1, 8):
+                prev = int(table[s - 1, i])
+                table[s, i] = (prev >> 8) ^ int(table[0, prev & 0xFF])
+        return table
+
+    CRC_TABLE = _build_table()
+
+    @njit(cache=True)
+    def _crc32_slice8(data, crc):
+        crc = ~crc & np.uint32(0xFFFFFFFF)
+        i = 0
+        n = data.shape[0]
+        while i + 8 <= n:
+            crc ^= (
+                np.uint32(data[i])
+                | (np.uint32(data[i + 1]) << 8)
+                | (np.uint32(data[i + 2]) << 16)
+                | (np.uint32(data[i + 3]) << 24)
+            )
+            crc = (
+                CRC_TABLE[7, crc & 0xFF]
+                ^ CRC_TABLE[6, (crc >> 8) & 0xFF]
+                ^ CRC_TABLE[5, (crc >> 16) & 0xFF]
+                ^ CRC_TABLE[4, (crc >> 24) & 0xFF]
+                ^ CRC_TABLE[3, data[i + 4]]
+                ^ CRC_TABLE[2, data[i + 5]]
+                ^ CRC_TABLE[1, data[i + 6]]
+                ^ CRC_TABLE[0, data[i + 7]]
+            )
+            i += 8
+        while i < n:
+            crc = CRC_TABLE[0, (crc ^ np.uint32(data[i])) & 0xFF] ^ (crc >> 8)
+            i += 1
+        return ~crc & np.uint32(0xFFFFFFFF)
+
+    def crc32(data, value: int = 0) -> int:
+        """Drop-in replacement for zlib.crc32 compiled with Numba."""
+        view = np.frombuffer(data, dtype=np.uint8)  # zero-copy view
+        return int(_crc32_slice8(view, np.uint32(value)))
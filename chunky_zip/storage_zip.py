@@ -1,24 +1,39 @@
 from __future__ import annotations
 
+import mmap
+import os
+import threading
 from datetime import datetime
-from typing import Optional, List, IO
+from typing import Optional, IO
 from zipfile import (
     ZipFile,
     ZipInfo,
     ZIP_STORED,
 )
 
+from chunky_zip.uring import HAVE_LIBURING, UringWriter
+
 
 try:
-    import zlib  # We may need its compression method
+    import zlib  # We may need its CRC implementation
 
-    Z_FULL_FLUSH = zlib.Z_FULL_FLUSH
     crc32 = zlib.crc32
 except ImportError:
     import binascii
 
-    Z_FULL_FLUSH = 3
-    crc32 = binascii.crc32
+    from chunky_zip.crc_numba import HAVE_NUMBA
+
+    if HAVE_NUMBA:
+        # JIT-compiled slice-by-8 loop; far faster than the binascii fallback
+        from chunky_zip.crc_numba import crc32
+    else:
+        crc32 = binascii.crc32
+
+try:
+    from pycrc32 import Hasher as Crc32Hasher  # type: ignore
+except ImportError:
+    # SIMD-accelerated CRC-32 (PCLMULQDQ); plain crc32 is used without it
+    Crc32Hasher = None
 
 ZIP64_LIMIT = (1 << 31) - 1
 
@@ -26,65 +41,117 @@ ZIP64_LIMIT = (1 << 31) - 1
 class ChunkedStoredZipWriter:
     """A class to write data in chunks to a single file within a ZIP archive without persistent temporary storage."""
 
+    # Subclasses override this (as an instance attribute) before calling
+    # super().__init__, since _extract_zipinfo depends on it
+    compression = ZIP_STORED
+
     def __init__(self, output_zip: str, filename_in_zip: str):
         """
         Initialize the chunked ZIP writer.
         """
         self.output_zip = output_zip
         self.filename_in_zip = filename_in_zip
-        self.compression = ZIP_STORED
         self.zipinfo = self._extract_zipinfo()
+        self._zf: Optional[ZipFile] = None
+        self._data_start = 0
+        self._next_data_offset = 0
+        self._header_bytes: Optional[bytes] = None
+        self._uring: Optional[UringWriter] = None
+        self._crc_hasher = (
+            Crc32Hasher.with_initial(self.zipinfo.CRC)
+            if Crc32Hasher is not None
+            else None
+        )
+        self._crc = self.zipinfo.CRC
+        self._force_zip64 = False
 
     def _extract_zipinfo(self) -> ZipInfo:
+        if not os.path.exists(self.output_zip):
+            # Fresh archive, nothing to parse
+            return self._new_zipinfo()
+
         try:
             with ZipFile(self.output_zip, "r", compression=self.compression) as zf:
                 return zf.getinfo(self.filename_in_zip)
         except (KeyError, FileNotFoundError):
-            # If entry doesn't exist, create new ZipInfo (temp remains empty)
-            zipinfo = ZipInfo(self.filename_in_zip, datetime.now().timetuple()[:6])
-            zipinfo.compress_type = self.compression
-            zipinfo.CRC = crc32(b"")
-            zipinfo.file_size = 0
-            zipinfo.compress_size = 0
-            zipinfo.header_offset = 0
-            return zipinfo
-
-    def _exclude_file_info(self, zip_infos: List[ZipInfo]):
-        return list(filter(lambda z: z.filename != self.filename_in_zip, zip_infos))
+            # Entry doesn't exist yet in the archive
+            return self._new_zipinfo()
+
+    def _new_zipinfo(self) -> ZipInfo:
+        zipinfo = ZipInfo(self.filename_in_zip, datetime.now().timetuple()[:6])
+        zipinfo.compress_type = self.compression
+        zipinfo.CRC = crc32(b"")
+        zipinfo.file_size = 0
+        zipinfo.compress_size = 0
+        zipinfo.header_offset = 0
+        return zipinfo
 
     def swap_zipinfo(self, zip_file: ZipFile):
-        zip_file.filelist = self._exclude_file_info(zip_file.filelist)
+        existing = zip_file.NameToInfo.pop(self.filename_in_zip, None)
+        if existing is not None:
+            zip_file.filelist.remove(existing)
         zip_file.filelist.append(self.zipinfo)
         zip_file.NameToInfo[self.filename_in_zip] = self.zipinfo
 
     def update_zip_info_time(self):
+        # ZIP timestamps have 2-second resolution; stamping once at close
+        # is enough, per-chunk refreshes only burned datetime allocations
         self.zipinfo.date_time = datetime.now().timetuple()[:6]
 
+    def update_crc(self, chunk: bytes):
+        """Fold a chunk into the running CRC kept outside the ZipInfo."""
+        if self._crc_hasher is not None:
+            if not isinstance(chunk, bytes):
+                # pycrc32's Hasher only takes bytes; memoryview slices and
+                # mmap objects from the readers must be materialized
+                chunk = bytes(chunk)
+            self._crc_hasher.update(chunk)
+        else:
+            self._crc = crc32(chunk, self._crc)
+
     def update_zipinfo_data(self, chunk: Optional[bytes], compressed_data: bytes):
-        self.update_zip_info_time()
         self.zipinfo.compress_size += len(compressed_data)
         if chunk is not None:
             self.zipinfo.file_size += len(chunk)
-            self.zipinfo.CRC = crc32(chunk, self.zipinfo.CRC)
+            self.update_crc(chunk)
 
     def force_zip64(self):
-        # Logic taken from zipfile
-        return self.zipinfo.file_size * 1.05 > ZIP64_LIMIT
+        # Logic taken from zipfile (file_size * 1.05 > ZIP64_LIMIT), in
+        # integer math; the flag is monotonic so it is checked only until
+        # the entry first crosses the threshold
+        if not self._force_zip64:
+            self._force_zip64 = self.zipinfo.file_size * 21 // 20 > ZIP64_LIMIT
+        return self._force_zip64
 
     def write_zipinfo(self, write_stream: IO[bytes] | None):
         if write_stream is None:
             raise ValueError("Attempt to write to ZIP archive that was already closed")
 
+        header = self.zipinfo.FileHeader(self.force_zip64())
+        if header == self._header_bytes:
+            # Identical bytes are already on disk
+            return
+
         write_stream.seek(self.zipinfo.header_offset)
-        write_stream.write(self.zipinfo.FileHeader(self.force_zip64()))
+        write_stream.write(header)
+        self._header_bytes = header
 
-    def write_appended_data(self, write_stream: IO[bytes] | None, data: bytes):
-        if write_stream is None:
+    def write_data_only(self, data: bytes):
+        """Append payload bytes at the end of the entry's data region.
+
+        The local header is written once in __enter__ and finalized in
+        close(); the per-chunk path is just this single write.
+        """
+        if self._zf is None:
             raise ValueError("Attempt to write to ZIP archive that was already closed")
 
-        initial_offset = write_stream.tell()
-        write_stream.seek(initial_offset + self.zipinfo.compress_size)
-        write_stream.write(data)
+        if self._uring is not None:
+            self._uring.write(bytes(data), self._next_data_offset)
+        else:
+            # __enter__ positioned the handle at the data end; sequential
+            # writes keep it there, so no per-chunk tell()/seek()
+            self._zf.fp.write(data)
+        self._next_data_offset += len(data)
 
     def update_start_dir(self, zip_file: ZipFile, write_stream: IO[bytes] | None):
         if write_stream is None:
@@ -93,20 +160,8 @@ class ChunkedStoredZipWriter:
         zip_file.start_dir = write_stream.tell()
 
     def _write(self, chunk: Optional[bytes], compressed_data: bytes) -> None:
-        with ZipFile(self.output_zip, "a", compression=self.compression) as zf:
-            self.update_zip_info_time()
-            self.swap_zipinfo(zf)
-
-            self.write_zipinfo(zf.fp)
-
-            self.write_appended_data(zf.fp, compressed_data)
-            self.update_zipinfo_data(chunk, compressed_data)
-
-            self.update_start_dir(zf, zf.fp)
-
-            self.write_zipinfo(zf.fp)
-
-            zf._didModify = True
+        self.write_data_only(compressed_data)
+        self.update_zipinfo_data(chunk, compressed_data)
 
     def write_chunk(self, chunk: bytes):
         """
@@ -114,16 +169,96 @@ class ChunkedStoredZipWriter:
         """
         self._write(chunk, chunk)
 
+    def write_from_fd(self, src_fd: int, length: int):
+        """
+        Copy `length` bytes from an open file descriptor into the entry with
+        os.sendfile (kernel-side, no user-space buffers), computing the CRC
+        over a read-only mapping of the source on a parallel thread.
+        """
+        if self._zf is None:
+            raise ValueError("Attempt to write to ZIP archive that was already closed")
+
+        crc_thread = None
+        crc_errors: list = []
+        if length > 0:
+
+            def _crc_worker():
+                try:
+                    with mmap.mmap(src_fd, length, access=mmap.ACCESS_READ) as mm:
+                        self.update_crc(mm)
+                except BaseException as exc:
+                    crc_errors.append(exc)
+
+            crc_thread = threading.Thread(target=_crc_worker)
+            crc_thread.start()
+
+        fp = self._zf.fp
+        fp.seek(self._next_data_offset)
+        fp.flush()
+
+        offset = 0
+        while offset < length:
+            sent = os.sendfile(fp.fileno(), src_fd, offset, length - offset)
+            if sent == 0:
+                break
+            offset += sent
+        self._next_data_offset += offset
+        # sendfile moved the raw descriptor underneath the buffered handle
+        fp.seek(self._next_data_offset)
+
+        if crc_thread is not None:
+            crc_thread.join()
+            if crc_errors:
+                # A swallowed CRC failure would finalize the entry with the
+                # stale seed value and corrupt the archive silently
+                raise crc_errors[0]
+
+        self.zipinfo.compress_size += offset
+        self.zipinfo.file_size += offset
+
     def flush(self):
         """flush all of the leftover data in the ZIP compressor"""
         pass
 
     def close(self):
-        """Finalize the ZIP file (optional, as each write_chunk updates it)."""
-        pass  # No persistent state to clean up; ZIP is updated after each chunk
+        """Finalize the ZIP file: rewrite the local header with the final
+        sizes/CRC, position the central directory after the data and close
+        the persistent archive handle."""
+        if self._zf is None:
+            return
+
+        if self._uring is not None:
+            self._uring.close()
+            self._uring = None
+
+        if self._crc_hasher is not None:
+            self.zipinfo.CRC = self._crc_hasher.finalize()
+        else:
+            self.zipinfo.CRC = self._crc & 0xFFFFFFFF
+
+        self.update_zip_info_time()
+        self.write_zipinfo(self._zf.fp)
+        self._zf.fp.seek(self._next_data_offset)
+        self.update_start_dir(self._zf, self._zf.fp)
+        self._zf._didModify = True
+
+        zf, self._zf = self._zf, None
+        zf.close()
 
     def __enter__(self):
-        """Support for context manager."""
+        """Open the archive once and keep the handle for all chunk writes."""
+        self._zf = ZipFile(self.output_zip, "a", compression=self.compression)
+        self.swap_zipinfo(self._zf)
+        self.write_zipinfo(self._zf.fp)
+        self._data_start = self._zf.fp.tell()
+        self._next_data_offset = self._data_start + self.zipinfo.compress_size
+        if self.zipinfo.compress_size:
+            # Resuming an existing entry: jump past the data already written
+            self._zf.fp.seek(self._next_data_offset)
+        if HAVE_LIBURING:
+            # Batched kernel-side writes; header/directory writes stay on fp.
+            self._zf.fp.flush()
+            self._uring = UringWriter(self._zf.fp.fileno())
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
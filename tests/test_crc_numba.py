@@ -0,0 +1,29 @@
+from zlib import crc32 as zlib_crc32
+
+import pytest
+
+pytest.importorskip("numba")
+
+from chunky_zip.crc_numba import crc32
+
+
+def make_data(size):
+    # Deterministic non-trivial byte pattern
+    return bytes((i * 31 + 7) % 256 for i in range(size))
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 1023, 1024, 65536 + 3])
+def test_crc32_matches_zlib(size):
+    data = make_data(size)
+    assert crc32(data) == zlib_crc32(data)
+
+
+def test_crc32_chained_updates_match_zlib():
+    data = make_data(64 * 1024)
+    expected = zlib_crc32(data)
+
+    value = 0
+    for start in range(0, len(data), 1000):
+        value = crc32(data[start : start + 1000], value)
+
+    assert value == expected
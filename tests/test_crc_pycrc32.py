@@ -0,0 +1,47 @@
+import mmap
+import os
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+from zlib import crc32 as zlib_crc32
+
+import pytest
+
+pytest.importorskip("pycrc32")
+
+from chunky_zip import zip_file_in_chunks
+from chunky_zip.storage_zip import ChunkedStoredZipWriter
+from tests.utils import get_file_hash, get_zip_file_hash
+
+
+def make_data(size):
+    # Deterministic non-trivial byte pattern
+    return bytes((i * 31 + 7) % 256 for i in range(size))
+
+
+def test_update_crc_accepts_buffer_types(tmp_path):
+    data = make_data(64 * 1024)
+    source = tmp_path / "source.bin"
+    source.write_bytes(data[32 * 1024 :])
+
+    writer = ChunkedStoredZipWriter(str(tmp_path / "out.zip"), "out.txt")
+    writer.update_crc(data[:1000])
+    writer.update_crc(memoryview(data)[1000 : 32 * 1024])
+    with open(source, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        writer.update_crc(mm)
+
+    assert writer._crc_hasher is not None
+    assert writer._crc_hasher.finalize() == zlib_crc32(data)
+
+
+@pytest.mark.parametrize("compression", [ZIP_STORED, ZIP_DEFLATED])
+def test_zip_round_trip_with_pycrc32(tmp_path, compression):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(make_data(512 * 1024))
+    output_zip = tmp_path / f"output_{compression}.zip"
+
+    zip_file_in_chunks(str(input_file), str(output_zip), compression)
+
+    assert get_file_hash(str(input_file)) == get_zip_file_hash(
+        str(output_zip), os.path.basename(str(input_file))
+    )
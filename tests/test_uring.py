@@ -0,0 +1,47 @@
+import os
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+pytest.importorskip("liburing")
+
+from chunky_zip import zip_file_in_chunks
+from chunky_zip.uring import MAX_BATCH, UringWriter
+from tests.utils import get_file_hash, get_zip_file_hash
+
+
+def make_data(size):
+    # Deterministic non-trivial byte pattern
+    return bytes((i * 31 + 7) % 256 for i in range(size))
+
+
+def test_uring_writer_round_trip(tmp_path):
+    path = tmp_path / "out.bin"
+    # Enough writes to cross the MAX_BATCH submit threshold several times
+    chunks = [make_data(4096 + i) for i in range(3 * MAX_BATCH + 1)]
+
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        writer = UringWriter(fd)
+        offset = 0
+        for chunk in chunks:
+            writer.write(chunk, offset)
+            offset += len(chunk)
+        writer.close()
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b"".join(chunks)
+
+
+@pytest.mark.parametrize("compression", [ZIP_STORED, ZIP_DEFLATED])
+def test_zip_round_trip_with_uring(tmp_path, compression):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(make_data(512 * 1024))
+    output_zip = tmp_path / f"output_{compression}.zip"
+
+    zip_file_in_chunks(str(input_file), str(output_zip), compression)
+
+    assert get_file_hash(str(input_file)) == get_zip_file_hash(
+        str(output_zip), os.path.basename(str(input_file))
+    )
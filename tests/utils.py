@@ -1,5 +1,6 @@
 import hashlib
 import os
+import random
 import time
 from contextlib import contextmanager
 from typing import Any, Generator
@@ -7,6 +8,11 @@ from zipfile import ZipFile
 
 import psutil  # type: ignore
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
 
 def generate_file(filename, size_bytes, content_type="random"):
     chunk_size = 1024 * 1024  # 1MB chunks for writing
@@ -17,8 +23,17 @@ def generate_file(filename, size_bytes, content_type="random"):
     with open(filename, "wb") as f:
         bytes_written = 0
         if content_type == "random":
+            # Seeded PRNG bytes: much faster than os.urandom and makes
+            # the generated fixtures reproducible between runs
+            if np is not None:
+                make_bytes = np.random.default_rng(0).bytes
+            elif hasattr(random.Random, "randbytes"):
+                make_bytes = random.Random(0).randbytes
+            else:
+                # Python < 3.9 has no randbytes
+                make_bytes = os.urandom
             while bytes_written < size_bytes:
-                chunk = os.urandom(min(chunk_size, size_bytes - bytes_written))
+                chunk = make_bytes(min(chunk_size, size_bytes - bytes_written))
                 f.write(chunk)
                 bytes_written += len(chunk)
         elif content_type == "repetitive":